@@ -372,29 +372,29 @@ def merge_duplicate_rounds(df):
     for (tournament, year, source_file), group_df in df_grouped:
         print(f"Processing {len(group_df)} rounds from {tournament} ({year}) - {source_file}")
         
-        for idx, row in group_df.iterrows():
-            team_a = row['Team_Code']
-            team_b = row['Opponent_Code']
-            round_num = row['Round']
+        for row in group_df.itertuples(index=False):
+            team_a = row.Team_Code
+            team_b = row.Opponent_Code
+            round_num = row.Round
             
             # Handle BYE and FORFEIT rounds separately - they don't need merging
             if team_b in ['BYE', 'FORFEIT']:
                 merged_round = {
                     'Round_Number': round_num,
-                    'Tournament_Name': row['Tournament_Name'],
-                    'Year': row['Year'],
-                    'Source_File': row['Source_File'],
+                    'Tournament_Name': row.Tournament_Name,
+                    'Year': row.Year,
+                    'Source_File': row.Source_File,
                     'Team1_Code': team_a,
-                    'Team1_Side': row['Side'],
-                    'Team1_Member1_Name': row['Member1_Name'],
-                    'Team1_Member2_Name': row['Member2_Name'],
-                    'Team1_Member1_Points': row['Member1_Points'],
-                    'Team1_Member1_Rank': row['Member1_Rank'],
-                    'Team1_Member2_Points': row['Member2_Points'],
-                    'Team1_Member2_Rank': row['Member2_Rank'],
-                    'Team1_Won': row['Won'],
+                    'Team1_Side': row.Side,
+                    'Team1_Member1_Name': row.Member1_Name,
+                    'Team1_Member2_Name': row.Member2_Name,
+                    'Team1_Member1_Points': row.Member1_Points,
+                    'Team1_Member1_Rank': row.Member1_Rank,
+                    'Team1_Member2_Points': row.Member2_Points,
+                    'Team1_Member2_Rank': row.Member2_Rank,
+                    'Team1_Won': row.Won,
                     'Team2_Code': team_b,
-                    'Team2_Side': 'Neg' if row['Side'] == 'Aff' else 'Aff',  # Opposite of Team1
+                    'Team2_Side': 'Neg' if row.Side == 'Aff' else 'Aff',  # Opposite of Team1
                     'Team2_Member1_Name': '',
                     'Team2_Member2_Name': '',
                     'Team2_Member1_Points': 0,
@@ -406,8 +406,9 @@ def merge_duplicate_rounds(df):
                 merged_rounds.append(merged_round)
                 continue
             
-            # Create a sorted pair to avoid duplicates (A vs B is same as B vs A)
-            pair_key = tuple(sorted([team_a, team_b]) + [round_num, tournament, year, source_file])
+            # Create an ordered pair to avoid duplicates (A vs B is same as B vs A)
+            low_team, high_team = (team_a, team_b) if team_a <= team_b else (team_b, team_a)
+            pair_key = (low_team, high_team, round_num, tournament, year, source_file)
             
             if pair_key in processed_pairs:
                 continue
@@ -450,12 +451,12 @@ def merge_duplicate_rounds(df):
                     opponent_row['Member1_Rank'] = 4
                     opponent_row['Member2_Points'] = 0
                     opponent_row['Member2_Rank'] = 4
-                    opponent_row['Side'] = 'Neg' if row['Side'] == 'Aff' else 'Aff'  # Opposite side
+                    opponent_row['Side'] = 'Neg' if row.Side == 'Aff' else 'Aff'  # Opposite side
                     
                     print(f"Info: Found FORFEIT match for {team_a} vs {team_b} in round {round_num}")
                 else:
                     # Strategy 3: Check if current team forfeited but opponent sees it as regular win
-                    if row['Result'] == 'L' and row['Opponent_Code'] != 'FORFEIT':
+                    if row.Result == 'L' and row.Opponent_Code != 'FORFEIT':
                         # Check if there's a team that won against us in this round
                         potential_forfeit_winner = group_df[
                             (group_df['Team_Code'] == team_b) & 
@@ -464,7 +465,7 @@ def merge_duplicate_rounds(df):
                         ]
                         
                         # Check if our speaker points are 0 (indicating forfeit)
-                        if (row['Member1_Points'] == 0 and row['Member2_Points'] == 0 and 
+                        if (row.Member1_Points == 0 and row.Member2_Points == 0 and 
                             len(potential_forfeit_winner) == 1):
                             opponent_row = potential_forfeit_winner.iloc[0]
                             print(f"Info: Detected forfeit situation for {team_a} vs {team_b} in round {round_num}")
@@ -477,27 +478,27 @@ def merge_duplicate_rounds(df):
                 # Create merged round data
                 merged_round = {
                     'Round_Number': round_num,
-                    'Tournament_Name': row['Tournament_Name'],
-                    'Year': row['Year'],
-                    'Source_File': row['Source_File'],
-                    'Team1_Code': team1['Team_Code'],
-                    'Team1_Side': team1['Side'],
-                    'Team1_Member1_Name': team1['Member1_Name'],
-                    'Team1_Member2_Name': team1['Member2_Name'],
-                    'Team1_Member1_Points': team1['Member1_Points'],
-                    'Team1_Member1_Rank': team1['Member1_Rank'],
-                    'Team1_Member2_Points': team1['Member2_Points'],
-                    'Team1_Member2_Rank': team1['Member2_Rank'],
-                    'Team1_Won': 1 if team1['Result'] == 'W' else 0,
-                    'Team2_Code': team2['Team_Code'],
-                    'Team2_Side': team2['Side'],
-                    'Team2_Member1_Name': team2['Member1_Name'],
-                    'Team2_Member2_Name': team2['Member2_Name'],
-                    'Team2_Member1_Points': team2['Member1_Points'],
-                    'Team2_Member1_Rank': team2['Member1_Rank'],
-                    'Team2_Member2_Points': team2['Member2_Points'],
-                    'Team2_Member2_Rank': team2['Member2_Rank'],
-                    'Team2_Won': 1 if team2['Result'] == 'W' else 0,
+                    'Tournament_Name': row.Tournament_Name,
+                    'Year': row.Year,
+                    'Source_File': row.Source_File,
+                    'Team1_Code': team1.Team_Code,
+                    'Team1_Side': team1.Side,
+                    'Team1_Member1_Name': team1.Member1_Name,
+                    'Team1_Member2_Name': team1.Member2_Name,
+                    'Team1_Member1_Points': team1.Member1_Points,
+                    'Team1_Member1_Rank': team1.Member1_Rank,
+                    'Team1_Member2_Points': team1.Member2_Points,
+                    'Team1_Member2_Rank': team1.Member2_Rank,
+                    'Team1_Won': 1 if team1.Result == 'W' else 0,
+                    'Team2_Code': team2.Team_Code,
+                    'Team2_Side': team2.Side,
+                    'Team2_Member1_Name': team2.Member1_Name,
+                    'Team2_Member2_Name': team2.Member2_Name,
+                    'Team2_Member1_Points': team2.Member1_Points,
+                    'Team2_Member1_Rank': team2.Member1_Rank,
+                    'Team2_Member2_Points': team2.Member2_Points,
+                    'Team2_Member2_Rank': team2.Member2_Rank,
+                    'Team2_Won': 1 if team2.Result == 'W' else 0,
                 }
                 
                 merged_rounds.append(merged_round)
@@ -533,29 +534,29 @@ def merge_duplicate_rounds(df):
             'Year': year,
             'Source_File': source_file,
             'Team1_Code': team_a,
-            'Team1_Side': row['Side'],
-            'Team1_Member1_Name': row['Member1_Name'],
-            'Team1_Member2_Name': row['Member2_Name'],
-            'Team1_Member1_Points': row['Member1_Points'],
-            'Team1_Member1_Rank': row['Member1_Rank'],
-            'Team1_Member2_Points': row['Member2_Points'],
-            'Team1_Member2_Rank': row['Member2_Rank'],
-            'Team1_Won': 1 if row['Result'] == 'W' else 0,
+            'Team1_Side': row.Side,
+            'Team1_Member1_Name': row.Member1_Name,
+            'Team1_Member2_Name': row.Member2_Name,
+            'Team1_Member1_Points': row.Member1_Points,
+            'Team1_Member1_Rank': row.Member1_Rank,
+            'Team1_Member2_Points': row.Member2_Points,
+            'Team1_Member2_Rank': row.Member2_Rank,
+            'Team1_Won': 1 if row.Result == 'W' else 0,
             'Team2_Code': team_b,
-            'Team2_Side': 'Neg' if row['Side'] == 'Aff' else 'Aff',
+            'Team2_Side': 'Neg' if row.Side == 'Aff' else 'Aff',
             'Team2_Member1_Name': 'MISSING_DATA',
             'Team2_Member2_Name': 'MISSING_DATA',
             'Team2_Member1_Points': 0,
             'Team2_Member1_Rank': 0,
             'Team2_Member2_Points': 0,
             'Team2_Member2_Rank': 0,
-            'Team2_Won': 0 if row['Result'] == 'W' else 1,
+            'Team2_Won': 0 if row.Result == 'W' else 1,
         }
         
         merged_rounds.append(merged_round)
         
         # Only warn for truly problematic cases (not FORFEIT-related)
-        if team_b not in ['BYE', 'FORFEIT'] and row['Member1_Points'] > 0:
+        if team_b not in ['BYE', 'FORFEIT'] and row.Member1_Points > 0:
             print(f"Warning: No matching opponent found for {team_a} vs {team_b} in round {round_num} at {tournament} ({year})")
     
     print(f"Successfully merged {len(merged_rounds)} rounds ({len(merged_rounds) - len(unmatched_rounds)} matched pairs + {len(unmatched_rounds)} unmatched)")
@@ -666,8 +667,7 @@ def main():
         
         # Statistics by source file and tournament
         print(f"\nStatistics by source file:")
-        for source_file in sorted(merged_df['Source_File'].unique()):
-            file_df = merged_df[merged_df['Source_File'] == source_file]
+        for source_file, file_df in merged_df.groupby('Source_File'):
             file_teams = set(list(file_df['Team1_Code']) + list(file_df['Team2_Code']))
             file_teams.discard('BYE')
             file_teams.discard('FORFEIT')
@@ -688,8 +688,8 @@ def main():
         # Count rounds by round number
         print(f"\nRounds by round number:")
         round_counts = merged_df['Round_Number'].value_counts().sort_index()
-        for round_num in sorted(round_counts.index):
-            print(f"  Round {round_num}: {round_counts[round_num]} rounds")
+        for round_num, count in round_counts.items():
+            print(f"  Round {round_num}: {count} rounds")
         
         # Calculate speaker point statistics
         all_points = []
@@ -723,32 +723,23 @@ def main():
                 print(f"  Team2 Member 2: {sum(team2_mem2_points)/len(team2_mem2_points):.2f}")
             
             # Calculate speaker points by side (Aff/Neg)
-            aff_team1_df = merged_df[merged_df['Team1_Side'] == 'Aff']
-            aff_team2_df = merged_df[merged_df['Team2_Side'] == 'Aff']
-            neg_team1_df = merged_df[merged_df['Team1_Side'] == 'Neg']
-            neg_team2_df = merged_df[merged_df['Team2_Side'] == 'Neg']
-            
-            all_aff_points = []
-            if len(aff_team1_df) > 0:
-                all_aff_points.extend([p for p in aff_team1_df['Team1_Member1_Points'].tolist() if p > 0])
-                all_aff_points.extend([p for p in aff_team1_df['Team1_Member2_Points'].tolist() if p > 0])
-            if len(aff_team2_df) > 0:
-                all_aff_points.extend([p for p in aff_team2_df['Team2_Member1_Points'].tolist() if p > 0])
-                all_aff_points.extend([p for p in aff_team2_df['Team2_Member2_Points'].tolist() if p > 0])
-            
-            all_neg_points = []
-            if len(neg_team1_df) > 0:
-                all_neg_points.extend([p for p in neg_team1_df['Team1_Member1_Points'].tolist() if p > 0])
-                all_neg_points.extend([p for p in neg_team1_df['Team1_Member2_Points'].tolist() if p > 0])
-            if len(neg_team2_df) > 0:
-                all_neg_points.extend([p for p in neg_team2_df['Team2_Member1_Points'].tolist() if p > 0])
-                all_neg_points.extend([p for p in neg_team2_df['Team2_Member2_Points'].tolist() if p > 0])
-            
+            def side_points(side):
+                """Collect all non-zero speaker points for teams on the given side"""
+                points = np.concatenate([
+                    merged_df.loc[merged_df[f'{team}_Side'] == side,
+                                  [f'{team}_Member1_Points', f'{team}_Member2_Points']].to_numpy(dtype=float).ravel()
+                    for team in ['Team1', 'Team2']
+                ])
+                return points[points > 0]
+
+            all_aff_points = side_points('Aff')
+            all_neg_points = side_points('Neg')
+
             print(f"\nAverage speaker points by side:")
-            if all_aff_points:
-                print(f"  Aff speakers: {sum(all_aff_points)/len(all_aff_points):.2f}")
-            if all_neg_points:
-                print(f"  Neg speakers: {sum(all_neg_points)/len(all_neg_points):.2f}")
+            if all_aff_points.size:
+                print(f"  Aff speakers: {all_aff_points.mean():.2f}")
+            if all_neg_points.size:
+                print(f"  Neg speakers: {all_neg_points.mean():.2f}")
         else:
             print("\nNo speaker point data available.")
         
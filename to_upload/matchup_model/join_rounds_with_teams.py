@@ -6,12 +6,41 @@ opens the corresponding year file, and adds team statistics such as
 win rate, number of tournaments, and debate rounds to the data.
 """
 
+import numpy as np
 import pandas as pd
+import hashlib
 import json
 import os
+import pickle
 import re
-from typing import Dict, List, Any, Optional
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+# Parsed year and tournament files are cached here (outside to_upload/ so they are never uploaded)
+CACHE_DIR = ".cache"
+
+# Words ignored when fuzzy matching tournament names
+TOURNAMENT_FILLER_WORDS_RE = re.compile(r'\b(20\d{2}|tournament|invitational|classic|championship|forum|of|the|and|in|at)\b')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Characters stripped from names before matching
+NAME_PUNCTUATION_TABLE = str.maketrans('', '', "'.-")
+
+# Common surname prefixes, collapsed wherever they start or end a word
+SURNAME_PREFIXES = {'de la': 'dela', 'van der': 'vander', 'mac': 'mc'}
+SURNAME_PREFIX_RE = re.compile('|'.join(
+    f'(?<= ){re.escape(prefix)}|{re.escape(prefix)}(?= )'
+    for prefix in sorted(SURNAME_PREFIXES, key=len, reverse=True)
+))
+
+@lru_cache(maxsize=100_000)
 def normalize_name(name: str) -> str:
     """Normalize a name for matching by removing punctuation, extra spaces, and converting to lowercase."""
     if not name:
@@ -21,22 +50,23 @@ def normalize_name(name: str) -> str:
     normalized = str(name).strip().lower()
     
     # Remove punctuation and normalize spaces
-    normalized = re.sub(r'[\'.\-]', '', normalized)
+    normalized = normalized.translate(NAME_PUNCTUATION_TABLE)
     normalized = re.sub(r'\s+', ' ', normalized)
     
     # Handle common surname prefixes
-    prefixes = {'de la': 'dela', 'van der': 'vander', 'mac': 'mc'}
-    for original, replacement in prefixes.items():
-        normalized = normalized.replace(f' {original} ', f' {replacement} ')
-        normalized = normalized.replace(f' {original}', f' {replacement}')
-        normalized = normalized.replace(f'{original} ', f'{replacement} ')
+    normalized = SURNAME_PREFIX_RE.sub(lambda match: SURNAME_PREFIXES[match.group(0)], normalized)
     
     return normalized.strip()
 
-def generate_name_variations(name: str) -> List[str]:
-    """Generate multiple variations of a name for flexible matching."""
+@lru_cache(maxsize=100_000)
+def generate_name_variations(name: str) -> Tuple[str, ...]:
+    """Generate multiple variations of a name for flexible matching.
+    
+    Results are cached since the same debaters appear in many rounds and year files,
+    so the variations are returned as an immutable tuple.
+    """
     if not name:
-        return [""]
+        return ("",)
     
     variations = set()
     original = str(name).strip()
@@ -53,10 +83,68 @@ def generate_name_variations(name: str) -> List[str]:
         variations.add(f"{parts[0][0]} {parts[-1]}")  # First initial + last name
         variations.add(f"{parts[0]} {parts[-1][0]}")  # First name + last initial
     
-    return list(filter(None, variations))  # Remove empty strings
+    # Remove empty strings; intern the rest since the same names recur across teams and years
+    return tuple(sys.intern(v) for v in variations if v)
+
+@lru_cache(maxsize=200_000)
+def build_pair_keys(name_a: str, name_b: str) -> Tuple[str, ...]:
+    """Build the lookup keys for every variation of a debater pair, in both orders."""
+    variations_a = generate_name_variations(name_a)
+    variations_b = generate_name_variations(name_b)
+    
+    keys = {f"{var_a}|{var_b}" for var_a in variations_a for var_b in variations_b}
+    keys.update(f"{var_b}|{var_a}" for var_a in variations_a for var_b in variations_b)
+    return tuple(keys)
+
+def parse_rank(value: Any) -> Optional[int]:
+    """Parse a rank or place value from the year files, returning None if it isn't a positive number."""
+    # Year files store these as strings, so check the exact types rather than calling str() on everything
+    if type(value) is str:
+        return int(value) if value.isdecimal() else None
+    if type(value) is int:
+        return value if value > 0 else None
+    return None
+
+def read_json(filepath: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-def load_year_file(year: int, year_files_dir: str = "to_upload/year_files") -> Dict[str, Any]:
-    """Load the JSON data for a specific year and create team mapping."""
+def get_cache_path(cache_dir: str, source_path: str) -> str:
+    """Name the pickle for a source file after its resolved path, so different directories never share a cache."""
+    source_path = os.path.realpath(source_path)
+    path_hash = hashlib.sha1(source_path.encode('utf-8')).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(cache_dir, f"{stem}_{path_hash}.pkl")
+
+def load_cache(cache_path: str, source_paths: List[str]) -> Any:
+    """Load a pickled result if it is newer than all of its source files, otherwise return None."""
+    try:
+        if os.path.getmtime(cache_path) < max(os.path.getmtime(path) for path in source_paths):
+            return None
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+def save_cache(cache_path: str, value: Any) -> None:
+    """Pickle a result so later runs can skip rebuilding it; failures only skip the cache."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_path}: {e}")
+
+def load_year_file(year: int, year_files_dir: str = "to_upload/year_files", cache_dir: str = CACHE_DIR) -> Dict[str, Any]:
+    """Load the JSON data for a specific year and create team mapping.
+    
+    The expanded mapping is cached as a pickle, rebuilt whenever the year file or this script changes.
+    """
     filename = f"debate_teams_{year}.json"
     filepath = os.path.join(year_files_dir, filename)
     
@@ -64,89 +152,82 @@ def load_year_file(year: int, year_files_dir: str = "to_upload/year_files") -> D
         print(f"Warning: Year file {filename} not found")
         return {}
     
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Create mapping with name variations
-        team_dict = {}
-        for team in data:
-            debater1_name = team.get('debater1', {}).get('name', '')
-            debater2_name = team.get('debater2', {}).get('name', '')
-            
-            if debater1_name and debater2_name:
-                # Generate all variations for both debaters
-                debater1_variations = generate_name_variations(debater1_name)
-                debater2_variations = generate_name_variations(debater2_name)
-                
-                # Create keys for all combinations in both orders
-                for d1_var in debater1_variations:
-                    for d2_var in debater2_variations:
-                        if d1_var and d2_var:
-                            team_dict[f"{d1_var}|{d2_var}"] = team
-                            team_dict[f"{d2_var}|{d1_var}"] = team
-                
+    cache_path = get_cache_path(os.path.join(cache_dir, "year_files"), filepath)
+    team_dict = load_cache(cache_path, [filepath, __file__])
+    if team_dict is not None:
         return team_dict
-    except Exception as e:
+    
+    try:
+        data = read_json(filepath)
+    except (OSError, ValueError) as e:
         print(f"Error loading {filename}: {e}")
         return {}
+    
+    # Create mapping with name variations
+    team_dict = {}
+    for team in data:
+        # Parse numeric fields once so stats calculation doesn't redo the string work
+        team['_national_rank'] = parse_rank(team.get('national_rank'))
+        team['_state_rank'] = parse_rank(team.get('state_rank'))
+        for tournament in team.get('tournaments', []):
+            tournament['_place_num'] = parse_rank(tournament.get('place'))
+        
+        debater1_name = team.get('debater1', {}).get('name', '')
+        debater2_name = team.get('debater2', {}).get('name', '')
+        
+        if debater1_name and debater2_name:
+            # Map keys for all name variations in both orders to this team
+            team_dict.update(dict.fromkeys(build_pair_keys(debater1_name, debater2_name), team))
+    
+    save_cache(cache_path, team_dict)
+    return team_dict
 
 def create_team_mapping_from_rounds(rounds_df: pd.DataFrame) -> Dict[str, Dict[str, List[str]]]:
     """Create year-specific team code to member names mapping from rounds data."""
-    mapping = {}
+    mapping = {year: {} for year in rounds_df['Year'].unique()}
     
-    for year in rounds_df['Year'].unique():
-        year_rounds = rounds_df[rounds_df['Year'] == year]
-        year_mapping = {}
+    # Process both Team1 and Team2 data, keeping the first named row for each (year, code)
+    for team_prefix in ['Team1', 'Team2']:
+        columns = ['Year', f'{team_prefix}_Code', f'{team_prefix}_Member1_Name', f'{team_prefix}_Member2_Name']
+        team_data = rounds_df[columns].dropna(subset=columns[2:]).drop_duplicates(subset=columns[:2])
         
-        # Process both Team1 and Team2 data
-        for team_prefix in ['Team1', 'Team2']:
-            team_data = year_rounds[[f'{team_prefix}_Code', f'{team_prefix}_Member1_Name', f'{team_prefix}_Member2_Name']].drop_duplicates()
+        for year, team_code, member1, member2 in team_data.itertuples(index=False, name=None):
+            year_mapping = mapping[year]
+            if team_code in year_mapping:
+                continue
             
-            for _, row in team_data.iterrows():
-                team_code = row[f'{team_prefix}_Code']
-                member1 = row[f'{team_prefix}_Member1_Name']
-                member2 = row[f'{team_prefix}_Member2_Name']
-                
-                if pd.notna(member1) and pd.notna(member2):
-                    member1_variations = generate_name_variations(str(member1))
-                    member2_variations = generate_name_variations(str(member2))
-                    
-                    # Create all combination keys
-                    all_keys = set()
-                    for m1_var in member1_variations:
-                        for m2_var in member2_variations:
-                            if m1_var and m2_var:
-                                all_keys.add(f"{m1_var}|{m2_var}")
-                                all_keys.add(f"{m2_var}|{m1_var}")
-                    
-                    if team_code not in year_mapping:
-                        year_mapping[team_code] = list(all_keys)
-        
-        mapping[year] = year_mapping
+            member1, member2 = str(member1), str(member2)
+            
+            # Probe the canonical normalized pair first; the other variations are fallbacks
+            canonical_key = f"{normalize_name(member1)}|{normalize_name(member2)}"
+            year_mapping[team_code] = [canonical_key, *(key for key in build_pair_keys(member1, member2) if key != canonical_key)]
     
     return mapping
 
-def load_tournament_data(year: int, tournament_files_dir: str = "tournament_files") -> Dict[str, Any]:
-    """Load tournament data for a specific year."""
+def load_tournament_data(year: int, tournament_files_dir: str = "tournament_files", cache_dir: str = CACHE_DIR) -> Dict[str, Any]:
+    """Load tournament data for a specific year.
+    
+    The parsed dict is cached as a pickle, rebuilt whenever the tournament file or this script changes.
+    """
     filename = f"tournaments_{year}.json"
     filepath = os.path.join(tournament_files_dir, filename)
     
     if not os.path.exists(filepath):
         return {}
     
+    cache_path = get_cache_path(os.path.join(cache_dir, "tournament_files"), filepath)
+    tournament_dict = load_cache(cache_path, [filepath, __file__])
+    if tournament_dict is not None:
+        return tournament_dict
+    
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            tournaments = json.load(f)
+        tournaments = read_json(filepath)
         
         tournament_dict = {}
         for tournament in tournaments:
-            # Find Team Policy Debate population
-            tp_population = None
-            for event in tournament.get('events', []):
-                if 'Team Policy Debate' in event.get('name', ''):
-                    tp_population = int(event.get('population', 0))
-                    break
+            # Population of the first Team Policy Debate event, if any
+            tp_population = next((int(event.get('population', 0)) for event in tournament.get('events', [])
+                                  if 'Team Policy Debate' in event.get('name', '')), None)
             
             if tp_population:
                 tournament_dict[tournament['name']] = {
@@ -155,46 +236,69 @@ def load_tournament_data(year: int, tournament_files_dir: str = "tournament_file
                     'date': tournament.get('date', ''),
                     'url': tournament.get('url', '')
                 }
-        
-        return tournament_dict
     except Exception as e:
         print(f"Error loading tournament file {filename}: {e}")
         return {}
+    
+    save_cache(cache_path, tournament_dict)
+    return tournament_dict
+
+@lru_cache(maxsize=50_000)
+def extract_key_words(name: str) -> FrozenSet[str]:
+    """Extract the distinctive words of a tournament name for fuzzy matching."""
+    name = TOURNAMENT_FILLER_WORDS_RE.sub('', name.lower())
+    name = NON_WORD_RE.sub(' ', name)
+    return frozenset(w for w in name.split() if len(w) > 2)
+
+def build_tournament_index(tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Index a year's tournaments by key word so fuzzy matching only scores tournaments sharing a word."""
+    entries = []
+    word_index = defaultdict(list)
+    
+    for name, info in tournament_data.items():
+        name_key_words = extract_key_words(name)
+        if name_key_words:
+            for word in name_key_words:
+                word_index[word].append(len(entries))
+            entries.append((name_key_words, info))
+    
+    return {'tournaments': tournament_data, 'entries': entries, 'word_index': dict(word_index)}
 
-def match_tournament_name(tournament_name: str, tournament_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def match_tournament_name(tournament_name: str, tournament_index: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Find matching tournament using exact match first, then fuzzy matching."""
     # Try exact match first
+    tournament_data = tournament_index['tournaments']
     if tournament_name in tournament_data:
         return tournament_data[tournament_name]
     
-    # Extract key words for fuzzy matching
-    def extract_key_words(name):
-        name = re.sub(r'\b(20\d{2}|tournament|invitational|classic|championship|forum|of|the|and|in|at)\b', '', name.lower())
-        name = re.sub(r'[^\w\s]', ' ', name)
-        return set(w.strip() for w in name.split() if len(w) > 2)
-    
     tournament_key_words = extract_key_words(tournament_name)
     if not tournament_key_words:
         return None
     
-    # Find best fuzzy match
+    # Count shared key words per tournament from the posting lists; only tournaments
+    # sharing a word can score above zero
+    word_index = tournament_index['word_index']
+    shared_words = Counter()
+    for word in tournament_key_words:
+        shared_words.update(word_index.get(word, ()))
+    
+    # Find best fuzzy match, visiting candidates in file order
     best_match = None
     best_score = 0
     
-    for name, info in tournament_data.items():
-        name_key_words = extract_key_words(name)
-        if name_key_words:
-            intersection = len(tournament_key_words & name_key_words)
-            union = len(tournament_key_words | name_key_words)
-            score = intersection / union if union > 0 else 0
-            
-            if score > best_score and score > 0.3:  # At least 30% similarity
-                best_match = info
-                best_score = score
+    for position in sorted(shared_words):
+        name_key_words, info = tournament_index['entries'][position]
+        intersection = shared_words[position]
+        union = len(tournament_key_words) + len(name_key_words) - intersection
+        score = intersection / union
+        
+        if score > best_score and score > 0.3:  # At least 30% similarity
+            best_match = info
+            best_score = score
     
     return best_match
 
-def calculate_tournament_metrics(team_data: Dict[str, Any], tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_tournament_metrics(team_data: Dict[str, Any], tournament_index: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate tournament-based metrics for a team.""" 
     if not team_data or not team_data.get('tournaments'):
         return {'national_exposure': None, 'avg_tournament_size': None, 'tournament_points': None}
@@ -205,9 +309,9 @@ def calculate_tournament_metrics(team_data: Dict[str, Any], tournament_data: Dic
     
     for tournament in team_data.get('tournaments', []):
         tournament_name = tournament.get('name', '')
-        place = tournament.get('place', '')
+        place_num = tournament.get('_place_num')
         
-        tournament_info = match_tournament_name(tournament_name, tournament_data)
+        tournament_info = match_tournament_name(tournament_name, tournament_index)
         
         if tournament_info:
             # Collect state for national exposure
@@ -221,12 +325,8 @@ def calculate_tournament_metrics(team_data: Dict[str, Any], tournament_data: Dic
                 tournament_sizes.append(population)
                 
                 # Calculate tournament points (population / place)
-                try:
-                    place_num = int(place) if place and str(place).isdigit() else None
-                    if place_num and place_num > 0:
-                        total_tournament_points += population / place_num
-                except (ValueError, ZeroDivisionError):
-                    pass
+                if place_num:
+                    total_tournament_points += population / place_num
     
     return {
         'national_exposure': len(states_visited) if states_visited else None,
@@ -234,7 +334,7 @@ def calculate_tournament_metrics(team_data: Dict[str, Any], tournament_data: Dic
         'tournament_points': total_tournament_points if total_tournament_points > 0 else None
     }
 
-def calculate_team_stats(team_data: Dict[str, Any], tournament_data: Dict[str, Any] = None) -> Dict[str, Any]:
+def calculate_team_stats(team_data: Dict[str, Any], tournament_index: Dict[str, Any] = None) -> Dict[str, Any]:
     """Calculate team statistics from year data."""
     if not team_data:
         return {key: None for key in [
@@ -244,18 +344,14 @@ def calculate_team_stats(team_data: Dict[str, Any], tournament_data: Dict[str, A
             'avg_tournament_size', 'tournament_points'
         ]}
     
-    # Extract basic stats
+    # Extract basic stats (ranks are parsed when the year file is loaded)
     total_wins = int(team_data.get('total_wins', 0))
     total_losses = int(team_data.get('total_losses', 0))
     prelim_wins = int(team_data.get('prelim_wins', 0))
     prelim_losses = int(team_data.get('prelim_losses', 0))
     rank_points = float(team_data.get('rank_points', 0))
-    
-    # Handle ranks
-    national_rank = team_data.get('national_rank')
-    state_rank = team_data.get('state_rank')
-    national_rank = int(national_rank) if national_rank and str(national_rank).isdigit() else None
-    state_rank = int(state_rank) if state_rank and str(state_rank).isdigit() else None
+    national_rank = team_data.get('_national_rank')
+    state_rank = team_data.get('_state_rank')
     
     # Calculate derived stats
     total_rounds = total_wins + total_losses
@@ -272,7 +368,7 @@ def calculate_team_stats(team_data: Dict[str, Any], tournament_data: Dict[str, A
         avg_points_per_tournament = total_points / len(tournaments)
     
     # Calculate tournament metrics
-    tournament_metrics = calculate_tournament_metrics(team_data, tournament_data) if tournament_data else {}
+    tournament_metrics = calculate_tournament_metrics(team_data, tournament_index) if tournament_index and tournament_index['tournaments'] else {}
     
     return {
         'total_wins': total_wins,
@@ -315,13 +411,13 @@ def join_rounds_with_team_data():
     print(f"Found years: {years}")
     
     year_data = {}
-    tournament_data = {}
+    tournament_index = {}
     for year in years:
         year_data[year] = load_year_file(year)
-        tournament_data[year] = load_tournament_data(year)
-        print(f"Loaded {len(year_data[year])} teams and {len(tournament_data[year])} tournaments for {year}")
+        tournament_index[year] = build_tournament_index(load_tournament_data(year))
+        print(f"Loaded {len(year_data[year])} teams and {len(tournament_index[year]['tournaments'])} tournaments for {year}")
     
-    # Initialize new columns
+    # Stat columns added for each team
     stat_columns = [
         'Total_Wins', 'Total_Losses', 'Prelim_Wins', 'Prelim_Losses', 'Num_Tournaments',
         'Rank_Points', 'National_Rank', 'State_Rank', 'Win_Rate', 'Prelim_Win_Rate',
@@ -329,37 +425,61 @@ def join_rounds_with_team_data():
         'Avg_Tournament_Size', 'Tournament_Points'
     ]
     
-    for team in ['Team1', 'Team2']:
-        for col in stat_columns:
-            rounds_df[f'{team}_{col}'] = None
+    # Counts and ranks use the nullable Int32 dtype so unmatched teams stay empty rather than NaN floats
+    integer_stat_columns = {
+        'Total_Wins', 'Total_Losses', 'Prelim_Wins', 'Prelim_Losses', 'Num_Tournaments',
+        'National_Rank', 'State_Rank', 'Total_Rounds', 'National_Exposure'
+    }
     
-    # Process each round
-    print("Processing rounds...")
-    matches_found = 0
+    # Stack Team1 and Team2 into one long frame so each team is looked up in a single pass
+    teams = ['Team1', 'Team2']
+    teams_long = pd.concat([
+        rounds_df[['Year', f'{team}_Code']].rename(columns={f'{team}_Code': 'Code'}).assign(Side=team)
+        for team in teams
+    ], ignore_index=True)
     
-    for idx, row in rounds_df.iterrows():
-        if idx % 1000 == 0:
-            print(f"Processing round {idx + 1}/{len(rounds_df)}")
-        
-        year = row['Year']
-        year_teams = year_data.get(year, {})
-        year_tournaments = tournament_data.get(year, {})
+    # Assign an integer id to every unique (year, team code) pair
+    team_ids, unique_teams = pd.factorize(pd.MultiIndex.from_frame(teams_long[['Year', 'Code']]))
+    
+    # Calculate stats once per unique team
+    print(f"Calculating stats for {len(unique_teams)} unique teams...")
+    stats_arrays = {col: np.full(len(unique_teams), np.nan) for col in stat_columns}
+    team_matched = np.zeros(len(unique_teams), dtype=bool)
+    
+    # Different team codes can resolve to the same year file entry, so reuse its stats
+    stats_by_team = {}
+    
+    for team_id, (year, team_code) in enumerate(unique_teams):
+        team_keys = team_mapping.get(year, {}).get(team_code, [])
+        team_data = find_team_data(team_keys, year_data.get(year, {}))
         
-        # Process both teams
-        for team_num in [1, 2]:
-            team_code = row[f'Team{team_num}_Code']
-            team_keys = team_mapping.get(year, {}).get(team_code, [])
-            
-            team_data = find_team_data(team_keys, year_teams)
-            team_stats = calculate_team_stats(team_data, year_tournaments)
-            
+        if team_data and id(team_data) in stats_by_team:
+            team_stats = stats_by_team[id(team_data)]
+        else:
+            team_stats = calculate_team_stats(team_data, tournament_index.get(year))
             if team_data:
-                matches_found += 1
-            
-            # Update dataframe with stats
-            for col in stat_columns:
-                stat_key = col.lower()
-                rounds_df.at[idx, f'Team{team_num}_{col}'] = team_stats.get(stat_key)
+                stats_by_team[id(team_data)] = team_stats
+        
+        team_matched[team_id] = bool(team_data)
+        for col in stat_columns:
+            value = team_stats.get(col.lower())
+            if value is not None:
+                stats_arrays[col][team_id] = value
+    
+    # Gather stats for every team appearance back into typed Team1_*/Team2_* columns
+    print("Processing rounds...")
+    matches_found = int(team_matched[team_ids].sum())
+    
+    team_columns = {}
+    missing_counts = {}
+    for team in teams:
+        side_ids = team_ids[(teams_long['Side'] == team).to_numpy()]
+        for col in stat_columns:
+            dtype = 'Int32' if col in integer_stat_columns else 'float64'
+            team_columns[f'{team}_{col}'] = pd.array(stats_arrays[col][side_ids], dtype=dtype)
+        # Count missing stats from the NaN-filled array instead of rescanning the joined frame
+        missing_counts[team] = int(np.isnan(stats_arrays['Total_Rounds'][side_ids]).sum())
+    rounds_df = pd.concat([rounds_df, pd.DataFrame(team_columns, index=rounds_df.index)], axis=1)
     
     # Save results
     output_file = "to_upload/matchup_model/rounds_joined.csv"
@@ -369,9 +489,7 @@ def join_rounds_with_team_data():
     
     # Print summary
     print(f"\nSummary: {len(rounds_df)} rounds processed, {matches_found} team matches found")
-    missing_team1 = rounds_df['Team1_Total_Rounds'].isna().sum()
-    missing_team2 = rounds_df['Team2_Total_Rounds'].isna().sum()
-    print(f"Missing data: Team1={missing_team1}, Team2={missing_team2}")
+    print(f"Missing data: Team1={missing_counts['Team1']}, Team2={missing_counts['Team2']}")
 
 if __name__ == "__main__":
     join_rounds_with_team_data() 
\ No newline at end of file
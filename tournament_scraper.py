@@ -1,9 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import threading
+
+# lxml is an optional, much faster HTML parser; fall back to the stdlib parser.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional; without it every page is fetched
+    requests_cache = None
 
 # Constants
 HEADERS = {
@@ -11,6 +31,20 @@ HEADERS = {
 }
 BASE_URL = "http://www.speechranks.com"
 REQUEST_DELAY = 0.5
+MAX_WORKERS = 8
+
+# Fetched pages are cached for re-runs when requests-cache is installed. Kept short
+# because the update protocol re-scrapes the current season for new results.
+HTTP_CACHE_PATH = os.path.join('.cache', 'http_cache')
+HTTP_CACHE_EXPIRY = timedelta(days=1)
+
+# Detail pages are only read for their summary and listing tables
+DETAIL_PAGE_TABLES = SoupStrainer('table')
+
+# Request starts are spaced REQUEST_DELAY apart across all worker threads, capping the
+# scraper at 1 / REQUEST_DELAY (2) request starts per second with up to MAX_WORKERS in flight.
+_request_lock = threading.Lock()
+_next_request_time = 0.0
 
 def parse_tournament_date(date_str, year):
     """Convert tournament date to YYYY-MM-DD format, taking start date if range."""
@@ -37,12 +71,45 @@ def get_tournament_year(date_str, season_year):
         print(f"Error determining year for date '{date_str}': {e}")
         return int(season_year)
 
-def make_request(url):
-    """Make HTTP request with error handling."""
+def create_session():
+    """Create a shared HTTP session with a connection pool sized for the detail workers."""
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(HTTP_CACHE_PATH, expire_after=HTTP_CACHE_EXPIRY)
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=2 * MAX_WORKERS, pool_maxsize=2 * MAX_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def wait_for_request_slot():
+    """Block until at least REQUEST_DELAY has passed since the previous request started."""
+    global _next_request_time
+    with _request_lock:
+        now = time.monotonic()
+        wait = _next_request_time - now
+        _next_request_time = max(now, _next_request_time) + REQUEST_DELAY
+    if wait > 0:
+        time.sleep(wait)
+
+def get_cached_response(url, session):
+    """Return a fresh cached response for url, or None if the page has to be fetched."""
+    if requests_cache is None:
+        return None
+    response = session.get(url, only_if_cached=True)
+    return response if response.ok else None
+
+def make_request(url, session, parse_only=None):
+    """Make HTTP request with error handling, optionally parsing only the matching elements."""
     try:
-        response = requests.get(url, headers=HEADERS)
+        # Cached pages skip the request delay since they never reach the server
+        response = get_cached_response(url, session)
+        if response is None:
+            wait_for_request_slot()
+            response = session.get(url)
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        return BeautifulSoup(response.text, HTML_PARSER, parse_only=parse_only)
     except requests.RequestException as e:
         print(f"Error accessing {url}: {e}")
         return None
@@ -84,17 +151,22 @@ def save_tournaments(tournaments, year):
     os.makedirs('tournament_files', exist_ok=True)
     filename = os.path.join('tournament_files', f'tournaments_{year}.json')
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(tournaments, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Same bytes as json.dump(indent=2, ensure_ascii=False), serialised in C
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(tournaments, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(tournaments, f, indent=2, ensure_ascii=False)
     
     print(f"Saved {len(tournaments)} tournaments to {filename}")
 
-def scrape_tournament_list(year):
-    """Scrape all tournaments for a given year."""
+def scrape_tournament_list(year, session):
+    """Scrape all tournaments for a given year and return them."""
     url = f"{BASE_URL}/{int(year)-1}/tournaments"
     tournaments = []
     
-    soup = make_request(url)
+    soup = make_request(url, session)
     if not soup:
         return
     
@@ -118,23 +190,25 @@ def scrape_tournament_list(year):
             'state': tournament.get('class', [''])[0].split('-')[0],
             'date': parse_tournament_date(date_str, tournament_year)
         }
-        
-        # Get detailed info
-        print(f"Scraping details for {year}: {tournament_data['name']}, tournament year: ({tournament_year})")
-        detail_soup = make_request(tournament_data['url'])
-        if detail_soup:
-            tournament_data.update(extract_tournament_details(detail_soup))
-        
         tournaments.append(tournament_data)
-        time.sleep(REQUEST_DELAY)
     
-    # Save results
-    save_tournaments(tournaments, year)
+    # Get detailed info, fetching detail pages concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        detail_soups = executor.map(lambda t: make_request(t['url'], session, DETAIL_PAGE_TABLES), tournaments)
+        for tournament_data, detail_soup in zip(tournaments, detail_soups):
+            print(f"Scraped details for {year}: {tournament_data['name']}")
+            if detail_soup:
+                tournament_data.update(extract_tournament_details(detail_soup))
+    
+    return tournaments
 
 if __name__ == "__main__":
     target_years = [str(year) for year in range(2010, 2026)]
     #update protocol: target current year.
     #target_years = [str(datetime.now().year)]
 
+    session = create_session()
     for year in target_years:
-        scrape_tournament_list(year)
\ No newline at end of file
+        tournaments = scrape_tournament_list(year, session)
+        if tournaments is not None:
+            save_tournaments(tournaments, year)